@@ -16,30 +16,49 @@ API 端点（兼容 DCC Bridge 模式）:
   GET  /upload-status/  - 轮询上传状态
 """
 
+import asyncio
 import base64
 import datetime
 import hashlib
 import html
-import io
 import json
+import logging
 import os
 import platform
 import queue
+import re
 import secrets
+import shutil
 import sys
+import tempfile
 import threading
 import time
 import tkinter as tk
 import webbrowser
 import zipfile
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from urllib.parse import urlencode
 
 import httpx
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
 
+# Lazy %-style formatting defers argument rendering until a handler accepts
+# the record; the GUI attaches its own queue handler, so don't propagate to
+# the root logger's stdout handler (which is already redirected).
+logger = logging.getLogger("bridge")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# uvicorn runs with log_config=None, so its records (e.g. ASGI tracebacks)
+# propagate to the root logger; the GUI attaches a WARNING-level queue
+# handler to root in BridgeGUI.run() so they reach the activity log.
+
 # ============ Configuration ============
 
 ROBLOX_CLIENT_ID = "5736123519074675650"
@@ -57,15 +76,114 @@ ROBLOX_REVOKE_URL = "https://apis.roblox.com/oauth/v1/token/revoke"
 ROBLOX_ASSETS_URL = "https://apis.roblox.com/assets/v1/assets"
 
 SCOPES = "openid profile asset:read asset:write"
+
+# How long a fresh upstream poll answer is reused before asking Roblox again.
+# The webapp may poll every second, but Roblox state changes far less often.
+POLL_CACHE_TTL = 2.0
+
+# Static values derived from config -- computed once at import time so hot
+# paths don't re-encode them per request
+AUTH_HEADER = "Basic " + base64.b64encode(
+    f"{ROBLOX_CLIENT_ID}:{ROBLOX_CLIENT_SECRET}".encode()
+).decode()
+FRONTEND_URL_JSON = json.dumps(FRONTEND_URL)
+
+TARGET_EXTENSIONS = {
+    "fbx": (".fbx",),
+    "glb": (".glb",),
+    "gltf": (".gltf", ".glb"),
+    "obj": (".obj",),
+}
+EXT_TO_FORMAT = {
+    ".fbx": "fbx",
+    ".glb": "glb",
+    ".gltf": "gltf",
+    ".obj": "obj",
+}
+FORMAT_TO_CONTENT_TYPE = {
+    "fbx": "model/fbx",
+    "glb": "model/gltf-binary",
+    "gltf": "model/gltf+json",
+    "obj": "model/obj",
+}
+FILE_EXT_MAP = {
+    "fbx": "model.fbx",
+    "glb": "model.glb",
+    "gltf": "model.gltf",
+    "obj": "model.obj",
+}
+
 # ============ In-memory storage ============
 
-oauth_states: dict[str, dict] = {}
+# Both OrderedDicts are inserted in creation order, which equals expiry
+# order, so cleanup only ever needs to pop from the front.
+oauth_states: OrderedDict[str, dict] = OrderedDict()
 user_tokens: dict = {}
-upload_operations: dict[str, dict] = {}
+upload_operations: OrderedDict[str, dict] = OrderedDict()
+
+# Serializes token refreshes so concurrent requests can't double-refresh
+# (Roblox may invalidate one of the two new refresh tokens).
+_refresh_lock = asyncio.Lock()
+_refresh_task: "asyncio.Task | None" = None
+
+
+def _notify_gui_roblox_status(connected: bool, username: str = "") -> None:
+    """Push a connection-state change to the GUI, if one is attached."""
+    gui = getattr(app.state, "gui", None)
+    if gui is not None:
+        try:
+            gui.root.after(0, gui._apply_roblox_status, connected, username)
+        except tk.TclError:
+            pass
+
+
+def _prune_expired(entries: OrderedDict, max_age: float) -> None:
+    """Pop entries older than max_age seconds from the front (oldest first)."""
+    cutoff = time.time() - max_age
+    while entries:
+        oldest = next(iter(entries.values()))
+        if oldest.get("created_at", 0) >= cutoff:
+            break
+        entries.popitem(last=False)
 
 # ============ App Setup ============
 
-app = FastAPI(title="Meshy Roblox Bridge")
+
+async def _sweep_stale_state() -> None:
+    """
+    定期清理过期的 OAuth state / 上传记录
+    端点内的清理只在有流量时运行；这里兜底，保证长期驻留进程内存有界
+    """
+    while True:
+        await asyncio.sleep(60)
+        _prune_expired(oauth_states, 600)
+        _prune_expired(upload_operations, 3600)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Single pooled client shared by all endpoints -- every Roblox call hits
+    # the same host, so keep-alive saves a TCP+TLS handshake per request.
+    # HTTP/2 lets overlapping calls (refresh, upload, poll) multiplex over
+    # one connection instead of opening one each.
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(60.0),
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=300.0,
+        ),
+    )
+    sweep_task = asyncio.create_task(_sweep_stale_state())
+    yield
+    sweep_task.cancel()
+    _cancel_refresh()
+    await app.state.http.aclose()
+
+
+app = FastAPI(title="Meshy Roblox Bridge", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -78,59 +196,105 @@ app.add_middleware(
 # ============ Helper Functions ============
 
 
+# Bound once at import: skips the module attribute lookup on each call, and
+# CPython's hashlib.sha256 is already the OpenSSL-backed implementation
+# (hardware SHA extensions where the build supports them)
+_urlsafe_b64encode = base64.urlsafe_b64encode
+_sha256 = hashlib.sha256
+
+
 def generate_pkce() -> tuple[str, str]:
-    code_verifier = secrets.token_urlsafe(64)
-    code_challenge = base64.urlsafe_b64encode(
-        hashlib.sha256(code_verifier.encode()).digest()
+    # 48 random bytes -> 64 chars after unpadded base64, within the PKCE
+    # verifier range of 43-128; encode once instead of token_urlsafe's
+    # internal encode plus a re-encode
+    code_verifier = _urlsafe_b64encode(secrets.token_bytes(48)).rstrip(b"=").decode()
+    code_challenge = _urlsafe_b64encode(
+        _sha256(code_verifier.encode()).digest()
     ).rstrip(b"=").decode()
     return code_verifier, code_challenge
 
 
-def get_auth_header() -> str:
-    credentials = f"{ROBLOX_CLIENT_ID}:{ROBLOX_CLIENT_SECRET}"
-    encoded = base64.b64encode(credentials.encode()).decode()
-    return f"Basic {encoded}"
+def _id_token_sub(id_token: "str | None") -> "str | None":
+    """Extract the OpenID sub claim from an ID token payload (unverified)."""
+    if not id_token:
+        return None
+    try:
+        payload = id_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("sub")
+    except Exception:
+        return None
 
 
 async def refresh_access_token() -> bool:
     if not user_tokens.get("refresh_token"):
         return False
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            ROBLOX_TOKEN_URL,
-            headers={
-                "Authorization": get_auth_header(),
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": user_tokens["refresh_token"],
-            },
-        )
+    response = await app.state.http.post(
+        ROBLOX_TOKEN_URL,
+        headers={
+            "Authorization": AUTH_HEADER,
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": user_tokens["refresh_token"],
+        },
+    )
 
     if response.status_code == 200:
         data = response.json()
+        expires_in = data.get("expires_in", 900)
         user_tokens.update({
             "access_token": data["access_token"],
             "refresh_token": data.get("refresh_token", user_tokens["refresh_token"]),
-            "expires_at": time.time() + data.get("expires_in", 900),
+            "expires_at": time.time() + expires_in,
         })
-        print(f"[Token] Refreshed. Expires in {data.get('expires_in', 900)}s")
+        logger.info("[Token] Refreshed. Expires in %ss", expires_in)
+        _arm_refresh(expires_in - 120)
         return True
     else:
-        print(f"[Token] Refresh failed: {response.status_code} {response.text}")
+        logger.warning("[Token] Refresh failed: %s %s", response.status_code, response.text)
         return False
 
 
+async def _refresh_later(delay: float) -> None:
+    await asyncio.sleep(delay)
+    async with _refresh_lock:
+        await refresh_access_token()
+
+
+def _arm_refresh(delay: float) -> None:
+    """
+    安排一次后台 token 刷新（到期前 2 分钟），取代按请求触发的刷新
+    重复调用会取消上一个定时任务
+    """
+    global _refresh_task
+    if _refresh_task is not None and _refresh_task is not asyncio.current_task():
+        _refresh_task.cancel()
+    # Floor the delay so a short-lived token (expires_in <= 120) can't turn
+    # the self-re-arming refresh into a tight loop against the token endpoint
+    _refresh_task = asyncio.create_task(_refresh_later(max(delay, 30)))
+
+
+def _cancel_refresh() -> None:
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+
+
 async def get_valid_access_token() -> "str | None":
     if not user_tokens.get("access_token"):
         return None
 
     if user_tokens.get("expires_at", 0) < time.time() + 60:
-        success = await refresh_access_token()
-        if not success:
-            return None
+        # The lock coalesces concurrent callers into a single refresh;
+        # whoever waited re-checks before firing another one.
+        async with _refresh_lock:
+            if user_tokens.get("expires_at", 0) < time.time() + 60:
+                if not await refresh_access_token():
+                    return None
 
     return user_tokens["access_token"]
 
@@ -160,10 +324,7 @@ async def roblox_authorize():
     前端拿到 auth_url 后会在弹窗中打开
     """
     # Clean up expired states (older than 10 minutes)
-    cutoff = time.time() - 600
-    expired = [k for k, v in oauth_states.items() if v.get("created_at", 0) < cutoff]
-    for k in expired:
-        del oauth_states[k]
+    _prune_expired(oauth_states, 600)
 
     state = secrets.token_urlsafe(32)
     code_verifier, code_challenge = generate_pkce()
@@ -184,7 +345,7 @@ async def roblox_authorize():
     }
 
     auth_url = f"{ROBLOX_AUTH_URL}?{urlencode(params)}"
-    print(f"[OAuth] Generated auth URL for popup")
+    logger.info("[OAuth] Generated auth URL for popup")
 
     return {"auth_url": auth_url}
 
@@ -196,8 +357,10 @@ async def connect():
     """
     data = await roblox_authorize()
     auth_url = data["auth_url"]
-    print(f"[OAuth] Opening browser for authorization...")
-    webbrowser.open(auth_url)
+    logger.info("[OAuth] Opening browser for authorization...")
+    # webbrowser.open can synchronously spawn a child process (xdg-open on
+    # Linux), so keep it off the event loop
+    await asyncio.to_thread(webbrowser.open, auth_url)
 
     return {"success": True, "message": "Authorization page opened in browser"}
 
@@ -208,75 +371,189 @@ async def oauth_callback(code: str = Query(...), state: str = Query(...)):
     OAuth 回调端点
     Roblox 授权成功后会重定向到这里
     """
-    print(f"[OAuth] Callback received. State: {state[:8]}..., Code: {code[:8]}...")
+    logger.info("[OAuth] Callback received. State: %s..., Code: %s...", state[:8], code[:8])
 
     state_data = oauth_states.pop(state, None)
     if not state_data:
         return HTMLResponse(
-            content=_result_page("error", "Invalid state parameter. Please try again.", frontend_url=FRONTEND_URL),
+            content=_result_page("error", "Invalid state parameter. Please try again."),
             status_code=400,
         )
 
     code_verifier = state_data["code_verifier"]
 
     # Exchange code for token
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            ROBLOX_TOKEN_URL,
-            headers={
-                "Authorization": get_auth_header(),
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": ROBLOX_REDIRECT_URI,
-                "code_verifier": code_verifier,
-            },
-        )
+    response = await app.state.http.post(
+        ROBLOX_TOKEN_URL,
+        headers={
+            "Authorization": AUTH_HEADER,
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": ROBLOX_REDIRECT_URI,
+            "code_verifier": code_verifier,
+        },
+    )
 
     if response.status_code != 200:
         error_msg = f"Token exchange failed: {response.status_code} {response.text}"
-        print(f"[OAuth] {error_msg}")
+        logger.warning("[OAuth] %s", error_msg)
         return HTMLResponse(
-            content=_result_page("error", error_msg, frontend_url=FRONTEND_URL),
+            content=_result_page("error", error_msg),
             status_code=400,
         )
 
     token_data = response.json()
-    print(f"[OAuth] Token received successfully!")
-
-    # Get user info
-    async with httpx.AsyncClient() as client:
-        user_response = await client.get(
+    logger.info("[OAuth] Token received successfully!")
+
+    # Get user info -- unless the same account is re-authorizing, in which
+    # case the profile claims are stable and the cached dict can be reused
+    # (the ID token's sub matches the stored userId)
+    cached_profile = user_tokens.get("user_info") or {}
+    id_token_sub = _id_token_sub(token_data.get("id_token"))
+    if id_token_sub and id_token_sub == cached_profile.get("userId"):
+        profile = cached_profile
+        logger.info("[OAuth] Re-auth for %s, reusing cached profile",
+                    cached_profile.get("username") or "user")
+    else:
+        user_response = await app.state.http.get(
             ROBLOX_USERINFO_URL,
             headers={"Authorization": f"Bearer {token_data['access_token']}"},
         )
 
-    user_info = {}
-    if user_response.status_code == 200:
-        user_info = user_response.json()
-        print(f"[OAuth] User: {user_info.get('preferred_username', 'unknown')}")
+        user_info = {}
+        if user_response.status_code == 200:
+            user_info = user_response.json()
+            logger.info("[OAuth] User: %s", user_info.get("preferred_username", "unknown"))
+
+        profile = {
+            "userId": user_info.get("sub", ""),
+            "username": user_info.get("preferred_username", ""),
+            "displayName": user_info.get("name", ""),
+        }
 
     # Store tokens
     user_tokens.update({
         "access_token": token_data["access_token"],
         "refresh_token": token_data.get("refresh_token"),
         "expires_at": time.time() + token_data.get("expires_in", 900),
-        "user_info": {
-            "userId": user_info.get("sub", ""),
-            "username": user_info.get("preferred_username", ""),
-            "displayName": user_info.get("name", ""),
-        },
+        "user_info": profile,
         "connected_at": time.time(),
     })
+    _arm_refresh(token_data.get("expires_in", 900) - 120)
+    _notify_gui_roblox_status(True, profile.get("username", ""))
+
+    display_name = profile.get("displayName") or profile.get("username") or "User"
+    return HTMLResponse(content=_result_page("success", display_name))
+
+
+def _build_multipart(request_payload: str, file_name: str, spool, model_size: int, content_type: str):
+    """
+    手工构造流式 multipart/form-data 请求体
+    Content-Length 预先算好，httpx 无需为此把整个 spool 读进内存
+
+    Returns (async body generator, headers dict).
+    """
+    boundary = secrets.token_hex(16)
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="request"\r\n'
+        "Content-Type: application/json\r\n"
+        "\r\n"
+        f"{request_payload}\r\n"
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="fileContent"; filename="{file_name}"\r\n'
+        f"Content-Type: {content_type}\r\n"
+        "\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+
+    async def body():
+        yield head
+        while True:
+            chunk = spool.read(65536)
+            if not chunk:
+                break
+            yield chunk
+        yield tail
+
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + model_size + len(tail)),
+    }
+    return body(), headers
+
+
+async def _download_model(url: str):
+    """
+    下载模型文件，流式写入 spool
+    作为独立协程运行，可与 token 校验并行
+
+    Returns (spool, download_size).
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    try:
+        async with app.state.http.stream("GET", url) as model_response:
+            if model_response.status_code != 200:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to download model: {model_response.status_code}",
+                )
+            async for chunk in model_response.aiter_bytes(65536):
+                spool.write(chunk)
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=408, detail="Model download timed out")
+    download_size = spool.tell()
+    spool.seek(0)
+    logger.info("[Upload] Model downloaded (%d KB)", download_size // 1024)
+    return spool, download_size
+
+
+def _extract_model(spool, download_size: int, file_format: str):
+    """
+    从下载的文件中解析出模型文件（ZIP 时解压出目标成员）
+    同步、CPU 密集 —— 通过 run_in_threadpool 在工作线程中执行，避免阻塞事件循环
 
-    display_name = user_info.get("name", user_info.get("preferred_username", "User"))
-    return HTMLResponse(content=_result_page(
-        "success",
-        display_name,
-        frontend_url=FRONTEND_URL,
-    ))
+    Returns (model_spool, model_size, file_format).
+    """
+    # ZIP local-file headers start with PK\x03\x04 -- checking the first four
+    # bytes avoids is_zipfile's end-of-file scan and BytesIO wrapping
+    head = spool.read(4)
+    spool.seek(0)
+    if head != b"PK\x03\x04":
+        logger.info("[Upload] %s file (%d KB)", file_format.upper(), download_size // 1024)
+        return spool, download_size, file_format
+
+    extensions = TARGET_EXTENSIONS.get(file_format, (".glb", ".fbx"))
+    logger.info("[Upload] Extracting %s from ZIP...", file_format.upper())
+    with zipfile.ZipFile(spool) as zf:
+        # str.endswith matches a tuple of suffixes at C speed -- lowercase
+        # each name once, no per-extension generator
+        names = zf.namelist()
+        model_file = None
+        for name in names:
+            if name.lower().endswith(extensions):
+                model_file = name
+                break
+        if not model_file:
+            logger.warning("[Upload] No %s found in ZIP: %s", file_format, names)
+            raise HTTPException(
+                status_code=400,
+                detail=f"No {file_format} model file found in ZIP. Contents: {names}",
+            )
+
+        # Infer format from extension if we were searching multiple
+        suffix = os.path.splitext(model_file.lower())[1]
+        file_format = EXT_TO_FORMAT.get(suffix, file_format)
+        model_spool = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+        with zf.open(model_file) as member:
+            shutil.copyfileobj(member, model_spool, 65536)
+        model_size = model_spool.tell()
+        model_spool.seek(0)
+        logger.info("[Upload] Extracted %s (%d KB)", file_format.upper(), model_size // 1024)
+        return model_spool, model_size, file_format
 
 
 class ImportRequest(BaseModel):
@@ -291,73 +568,36 @@ async def import_model(request: ImportRequest):
     """
     接收模型 URL 并上传到 Roblox（兼容 DCC Bridge /import 接口）
     """
-    access_token = await get_valid_access_token()
-    if not access_token:
-        raise HTTPException(status_code=401, detail="Not connected to Roblox. Please run /connect first.")
+    # Step 1: Start the download immediately -- it doesn't need the Roblox
+    # token, so it overlaps with token validation (which may hit the network
+    # for a refresh).
+    download_task = asyncio.create_task(_download_model(request.modelUrl))
 
-    user_id = user_tokens.get("user_info", {}).get("userId")
-    if not user_id:
-        raise HTTPException(status_code=400, detail="User ID not found")
+    try:
+        access_token = await get_valid_access_token()
+        if not access_token:
+            raise HTTPException(status_code=401, detail="Not connected to Roblox. Please run /connect first.")
 
-    print(f"[Upload] Starting: {request.displayName}")
+        user_id = user_tokens.get("user_info", {}).get("userId")
+        if not user_id:
+            raise HTTPException(status_code=400, detail="User ID not found")
+    except BaseException:
+        download_task.cancel()
+        raise
 
-    # Step 1: Download model file
-    try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=60.0) as client:
-            model_response = await client.get(request.modelUrl)
-            if model_response.status_code != 200:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to download model: {model_response.status_code}",
-                )
-            raw_data = model_response.content
-            print(f"[Upload] Model downloaded ({len(raw_data) // 1024} KB)")
-    except httpx.TimeoutException:
-        raise HTTPException(status_code=408, detail="Model download timed out")
+    logger.info("[Upload] Starting: %s", request.displayName)
+
+    spool, download_size = await download_task
 
     # Step 1.5: Extract model from ZIP if needed
     # Meshy may return ZIP (e.g. one .glb with embedded textures) or a single file (.glb)
-    file_format = request.format
-    model_data = raw_data
-    if zipfile.is_zipfile(io.BytesIO(raw_data)):
-        target_extensions = {
-            "fbx": [".fbx"],
-            "glb": [".glb"],
-            "gltf": [".gltf", ".glb"],
-            "obj": [".obj"],
-        }
-        extensions = target_extensions.get(file_format, [".glb", ".fbx"])
-        print(f"[Upload] Extracting {file_format.upper()} from ZIP...")
-        with zipfile.ZipFile(io.BytesIO(raw_data)) as zf:
-            model_file = None
-            for name in zf.namelist():
-                if any(name.lower().endswith(ext) for ext in extensions):
-                    model_file = name
-                    break
-            if model_file:
-                model_data = zf.read(model_file)
-                # Infer format from extension if we were searching multiple
-                if model_file.lower().endswith(".glb"):
-                    file_format = "glb"
-                elif model_file.lower().endswith(".gltf"):
-                    file_format = "gltf"
-                elif model_file.lower().endswith(".fbx"):
-                    file_format = "fbx"
-                elif model_file.lower().endswith(".obj"):
-                    file_format = "obj"
-                print(f"[Upload] Extracted {file_format.upper()} ({len(model_data) // 1024} KB)")
-            else:
-                all_files = zf.namelist()
-                print(f"[Upload] No {file_format} found in ZIP: {all_files}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"No {file_format} model file found in ZIP. Contents: {all_files}",
-                )
-    else:
-        print(f"[Upload] {file_format.upper()} file ({len(model_data) // 1024} KB)")
+    # Decompression is blocking, so run it off the event loop.
+    model_spool, model_size, file_format = await run_in_threadpool(
+        _extract_model, spool, download_size, request.format
+    )
 
     # Step 2: Upload to Roblox
-    request_payload = json.dumps({
+    request_payload = orjson.dumps({
         "assetType": "Model",
         "displayName": request.displayName,
         "description": request.description,
@@ -366,37 +606,27 @@ async def import_model(request: ImportRequest):
                 "userId": user_id,
             },
         },
-    })
+    }).decode()
 
-    format_to_content_type = {
-        "fbx": "model/fbx",
-        "glb": "model/gltf-binary",
-        "gltf": "model/gltf+json",
-        "obj": "model/obj",
-    }
-    content_type = format_to_content_type.get(file_format, "model/gltf-binary")
-    file_ext_map = {
-        "fbx": "model.fbx",
-        "glb": "model.glb",
-        "gltf": "model.gltf",
-        "obj": "model.obj",
-    }
-    file_name = file_ext_map.get(file_format, "model.glb")
+    content_type = FORMAT_TO_CONTENT_TYPE.get(file_format, "model/gltf-binary")
+    file_name = FILE_EXT_MAP.get(file_format, "model.glb")
+
+    body, upload_headers = _build_multipart(
+        request_payload, file_name, model_spool, model_size, content_type
+    )
+    upload_headers["Authorization"] = f"Bearer {access_token}"
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            upload_response = await client.post(
-                ROBLOX_ASSETS_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-                files={
-                    "request": (None, request_payload, "application/json"),
-                    "fileContent": (file_name, model_data, content_type),
-                },
-            )
+        upload_response = await app.state.http.post(
+            ROBLOX_ASSETS_URL,
+            headers=upload_headers,
+            content=body,
+            timeout=120.0,
+        )
     except httpx.TimeoutException:
         raise HTTPException(status_code=408, detail="Upload to Roblox timed out")
 
-    print(f"[Upload] Uploading to Roblox...")
+    logger.info("[Upload] Uploading to Roblox...")
 
     if upload_response.status_code not in (200, 201):
         raise HTTPException(
@@ -419,7 +649,7 @@ async def import_model(request: ImportRequest):
     if result.get("done"):
         if result.get("error"):
             error_msg = result["error"].get("message", "Unknown error")
-            print(f"[Upload] Immediately failed: {error_msg}")
+            logger.warning("[Upload] Immediately failed: %s", error_msg)
             upload_operations[operation_id].update({
                 "status": "failed",
                 "error": error_msg,
@@ -430,10 +660,10 @@ async def import_model(request: ImportRequest):
         asset_id = str(asset_response.get("assetId", ""))
 
         if not asset_id:
-            print(f"[Upload] Done but no assetId: {result}")
+            logger.warning("[Upload] Done but no assetId: %s", result)
             raise HTTPException(status_code=400, detail="Upload completed but no Asset ID returned")
 
-        print(f"[Upload] Immediately completed: assetId={asset_id}")
+        logger.info("[Upload] Immediately completed: assetId=%s", asset_id)
         upload_operations[operation_id].update({
             "status": "completed",
             "assetId": asset_id,
@@ -459,20 +689,27 @@ async def import_model(request: ImportRequest):
 
 
 @app.get("/upload-status/{operation_id}")
-async def upload_status(operation_id: str):
+async def upload_status(operation_id: str, response: Response):
     """轮询上传状态"""
     # Clean up expired upload operations (older than 1 hour)
-    cutoff = time.time() - 3600
-    expired = [k for k, v in upload_operations.items() if v.get("created_at", 0) < cutoff]
-    for k in expired:
-        del upload_operations[k]
-
-    access_token = await get_valid_access_token()
-    if not access_token:
-        raise HTTPException(status_code=401, detail="Not connected to Roblox")
+    _prune_expired(upload_operations, 3600)
 
-    # Return cached completed/failed status
+    # Cached answers don't need a Roblox token -- check them before token
+    # validation, which may otherwise trigger a refresh round-trip for a
+    # lookup that never leaves this process
     local_status = upload_operations.get(operation_id)
+
+    # Suggest a poll interval that backs off (500 ms -> 5 s) as the operation
+    # ages; clients that honor nextPollMs / Retry-After stop hammering the
+    # bridge for long-running Roblox moderation passes
+    next_poll_ms = 500
+    if local_status is not None:
+        poll_count = local_status.get("poll_count", 0)
+        local_status["poll_count"] = poll_count + 1
+        next_poll_ms = min(5000, 500 * 2 ** min(poll_count, 4))
+    # Retry-After has 1 s granularity; round sub-second hints up so we never
+    # tell compliant clients to retry immediately
+    response.headers["Retry-After"] = str(max(1, next_poll_ms // 1000))
     if local_status and local_status.get("status") in ("completed", "failed"):
         return {
             "success": local_status.get("status") == "completed",
@@ -485,29 +722,46 @@ async def upload_status(operation_id: str):
             },
         }
 
+    # Coalesce polling storms: reuse the last upstream answer briefly instead
+    # of forwarding every webapp poll to Roblox
+    if (
+        local_status
+        and local_status.get("last_poll_result") is not None
+        and time.time() - local_status.get("last_poll_at", 0) < POLL_CACHE_TTL
+    ):
+        # The cached body's nextPollMs was computed on an earlier poll; keep
+        # it in step with the Retry-After header sent above
+        cached = local_status["last_poll_result"]
+        cached["result"]["nextPollMs"] = next_poll_ms
+        return cached
+
+    access_token = await get_valid_access_token()
+    if not access_token:
+        raise HTTPException(status_code=401, detail="Not connected to Roblox")
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"https://apis.roblox.com/assets/v1/operations/{operation_id}",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+        op_response = await app.state.http.get(
+            f"https://apis.roblox.com/assets/v1/operations/{operation_id}",
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=30.0,
+        )
     except httpx.TimeoutException:
-        print(f"[Poll] Timeout, retrying...")
-        return {"success": True, "result": {"operationId": operation_id, "status": "processing"}}
+        logger.info("[Poll] Timeout, retrying...")
+        return {"success": True, "result": {"operationId": operation_id, "status": "processing", "nextPollMs": next_poll_ms}}
 
-    print(f"[Poll] Checking upload status...")
+    logger.info("[Poll] Checking upload status...")
 
-    if response.status_code != 200:
-        return {"success": True, "result": {"operationId": operation_id, "status": "processing"}}
+    if op_response.status_code != 200:
+        return {"success": True, "result": {"operationId": operation_id, "status": "processing", "nextPollMs": next_poll_ms}}
 
-    data = response.json()
+    data = orjson.loads(op_response.content)
 
     if data.get("done"):
         # Check if done with error vs done with success
         if data.get("error"):
             error = data["error"]
             error_msg = error.get("message", "Unknown error")
-            print(f"[Poll] Upload failed: {error_msg}")
+            logger.warning("[Poll] Upload failed: %s", error_msg)
             upload_operations[operation_id].update({
                 "status": "failed",
                 "error": error_msg,
@@ -525,7 +779,7 @@ async def upload_status(operation_id: str):
         asset_id = str(asset_response.get("assetId", ""))
 
         if not asset_id:
-            print(f"[Poll] Upload done but no asset ID returned")
+            logger.warning("[Poll] Upload done but no asset ID returned")
             upload_operations[operation_id].update({
                 "status": "failed",
                 "error": "Upload completed but no Asset ID returned",
@@ -539,7 +793,7 @@ async def upload_status(operation_id: str):
                 },
             }
 
-        print(f"[Poll] Upload completed!")
+        logger.info("[Poll] Upload completed!")
         upload_operations[operation_id].update({
             "status": "completed",
             "assetId": asset_id,
@@ -559,7 +813,7 @@ async def upload_status(operation_id: str):
     if data.get("error"):
         error = data["error"]
         error_msg = error.get("message", "Unknown error")
-        print(f"[Poll] Upload error: {error_msg[:80]}")
+        logger.warning("[Poll] Upload error: %s", error_msg[:80])
         upload_operations[operation_id].update({
             "status": "failed",
             "error": error_msg,
@@ -573,7 +827,11 @@ async def upload_status(operation_id: str):
             },
         }
 
-    return {"success": True, "result": {"operationId": operation_id, "status": "processing"}}
+    result = {"success": True, "result": {"operationId": operation_id, "status": "processing", "nextPollMs": next_poll_ms}}
+    if local_status is not None:
+        local_status["last_poll_at"] = time.time()
+        local_status["last_poll_result"] = result
+    return result
 
 
 @app.post("/disconnect")
@@ -581,109 +839,149 @@ async def disconnect():
     """断开 Roblox 连接"""
     if user_tokens.get("access_token"):
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    ROBLOX_REVOKE_URL,
-                    headers={
-                        "Authorization": get_auth_header(),
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    },
-                    data={"token": user_tokens["access_token"]},
-                )
+            await app.state.http.post(
+                ROBLOX_REVOKE_URL,
+                headers={
+                    "Authorization": AUTH_HEADER,
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+                data={"token": user_tokens["access_token"]},
+            )
         except Exception as e:
-            print(f"[OAuth] Token revocation failed: {e}")
+            logger.warning("[OAuth] Token revocation failed: %s", e)
 
+    _cancel_refresh()
     user_tokens.clear()
-    print("[OAuth] Disconnected")
+    _notify_gui_roblox_status(False)
+    logger.info("[OAuth] Disconnected")
     return {"success": True}
 
 
 # ============ HTML Pages ============
 
+# The result pages are almost entirely static -- precompute the invariant
+# chunks once (FRONTEND_URL baked in) so each callback only escapes the
+# message and concatenates.
+
+_SUCCESS_PAGE_HEAD = """\
+<!DOCTYPE html>
+<html>
+<head><title>Meshy Roblox Bridge - Connected</title>
+<style>
+    body { font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; min-height: 100vh; margin: 0; background: #1a1a2e; color: #fff; }
+    .container { text-align: center; padding: 40px; background: #16213e; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); }
+    .icon { font-size: 64px; margin-bottom: 16px; }
+    h1 { margin: 0 0 8px; font-size: 24px; }
+    p { color: #a0a0b0; margin: 8px 0; }
+</style>
+</head>
+<body>
+<div class="container">
+    <div class="icon">&#10003;</div>
+    <h1>Connected to Roblox!</h1>
+    <p>Welcome, """
+
+_SUCCESS_PAGE_TAIL = f"""</p>
+    <p>You can close this window and return to Meshy.</p>
+    <p style="color:#666; font-size:12px; margin-top:24px;">This window will close automatically.</p>
+</div>
+<script>
+    // Notify the opener (Meshy Webapp popup) that OAuth succeeded
+    if (window.opener) {{
+        window.opener.postMessage(
+            {{ type: "ROBLOX_OAUTH_SUCCESS" }},
+            {FRONTEND_URL_JSON}
+        );
+    }}
+    // Always auto-close -- even if window.opener is lost due to
+    // cross-origin navigation (e.g. "Change Account" flow)
+    setTimeout(function() {{ window.close(); }}, 2000);
+</script>
+</body>
+</html>
+"""
+
+_ERROR_PAGE_HEAD = """\
+<!DOCTYPE html>
+<html>
+<head><title>Meshy Roblox Bridge - Error</title>
+<style>
+    body { font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; min-height: 100vh; margin: 0; background: #1a1a2e; color: #fff; }
+    .container { text-align: center; padding: 40px; background: #16213e; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); max-width: 500px; }
+    .icon { font-size: 64px; margin-bottom: 16px; }
+    h1 { margin: 0 0 8px; font-size: 24px; color: #ff6b6b; }
+    p { color: #a0a0b0; margin: 0; word-break: break-all; }
+</style>
+</head>
+<body>
+<div class="container">
+    <div class="icon">&#10007;</div>
+    <h1>Connection Failed</h1>
+    <p>"""
+
+_ERROR_PAGE_MID = """</p>
+</div>
+<script>
+    if (window.opener) {
+        window.opener.postMessage(
+            { type: "ROBLOX_OAUTH_ERROR", error: """
+
+_ERROR_PAGE_TAIL = f""" }},
+            {FRONTEND_URL_JSON}
+        );
+    }}
+</script>
+</body>
+</html>
+"""
 
-def _result_page(status: str, message: str, frontend_url: str = "http://localhost:3700") -> str:
+
+def _result_page(status: str, message: str) -> str:
     if status == "success":
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head><title>Meshy Roblox Bridge - Connected</title>
-        <style>
-            body {{ font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; min-height: 100vh; margin: 0; background: #1a1a2e; color: #fff; }}
-            .container {{ text-align: center; padding: 40px; background: #16213e; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); }}
-            .icon {{ font-size: 64px; margin-bottom: 16px; }}
-            h1 {{ margin: 0 0 8px; font-size: 24px; }}
-            p {{ color: #a0a0b0; margin: 8px 0; }}
-        </style>
-        </head>
-        <body>
-        <div class="container">
-            <div class="icon">&#10003;</div>
-            <h1>Connected to Roblox!</h1>
-            <p>Welcome, {html.escape(message)}</p>
-            <p>You can close this window and return to Meshy.</p>
-            <p style="color:#666; font-size:12px; margin-top:24px;">This window will close automatically.</p>
-        </div>
-        <script>
-            // Notify the opener (Meshy Webapp popup) that OAuth succeeded
-            if (window.opener) {{
-                window.opener.postMessage(
-                    {{ type: "ROBLOX_OAUTH_SUCCESS" }},
-                    {json.dumps(frontend_url)}
-                );
-            }}
-            // Always auto-close -- even if window.opener is lost due to
-            // cross-origin navigation (e.g. "Change Account" flow)
-            setTimeout(function() {{ window.close(); }}, 2000);
-        </script>
-        </body>
-        </html>
-        """
-    else:
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head><title>Meshy Roblox Bridge - Error</title>
-        <style>
-            body {{ font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; min-height: 100vh; margin: 0; background: #1a1a2e; color: #fff; }}
-            .container {{ text-align: center; padding: 40px; background: #16213e; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); max-width: 500px; }}
-            .icon {{ font-size: 64px; margin-bottom: 16px; }}
-            h1 {{ margin: 0 0 8px; font-size: 24px; color: #ff6b6b; }}
-            p {{ color: #a0a0b0; margin: 0; word-break: break-all; }}
-        </style>
-        </head>
-        <body>
-        <div class="container">
-            <div class="icon">&#10007;</div>
-            <h1>Connection Failed</h1>
-            <p>{html.escape(message)}</p>
-        </div>
-        <script>
-            if (window.opener) {{
-                window.opener.postMessage(
-                    {{ type: "ROBLOX_OAUTH_ERROR", error: {json.dumps(message)} }},
-                    {json.dumps(frontend_url)}
-                );
-            }}
-        </script>
-        </body>
-        </html>
-        """
+        return _SUCCESS_PAGE_HEAD + html.escape(message) + _SUCCESS_PAGE_TAIL
+    return (
+        _ERROR_PAGE_HEAD
+        + html.escape(message)
+        + _ERROR_PAGE_MID
+        + json.dumps(message)
+        + _ERROR_PAGE_TAIL
+    )
 
 
 # ============ GUI ============
 
 
+class _QueueLogHandler(logging.Handler):
+    """Forward bridge log records to the GUI queue."""
+
+    def __init__(self, q: "queue.Queue[str]", level: int = logging.INFO):
+        super().__init__(level=level)
+        self._q = q
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._q.put(record.getMessage())
+        except Exception:
+            pass
+
+
 class _StdoutToQueue:
     """Redirect stdout to a queue so the GUI can display it thread-safely."""
 
     def __init__(self, q: "queue.Queue[str]", original):
         self._q = q
         self._orig = original
+        self._buf = ""
 
     def write(self, text: str):
-        stripped = text.rstrip("\n").strip()
-        if stripped:
-            self._q.put(stripped)
+        # print() calls write() at least twice per line (text, then "\n"),
+        # so buffer partial writes and only enqueue complete lines
+        self._buf += text
+        while "\n" in self._buf:
+            line, self._buf = self._buf.split("\n", 1)
+            line = line.strip()
+            if line:
+                self._q.put(line)
         if self._orig:
             try:
                 self._orig.write(text)
@@ -727,6 +1025,9 @@ class BridgeGUI:
     def __init__(self, port: int):
         self.port = port
         self._q: "queue.Queue[str]" = queue.Queue()
+        # Ring buffer backing the log widget -- retention is enforced here,
+        # not by querying the widget's own indices
+        self._lines: "deque[tuple[str, str, str]]" = deque(maxlen=500)
         self.root = tk.Tk()
         self.root.withdraw()   # hide until fully built to avoid blank flash on macOS
         self._build_window()
@@ -861,37 +1162,75 @@ class BridgeGUI:
 
     # ── Logging ───────────────────────────────────────────────────
 
+    # Server messages carry a fixed-case category prefix -- map it straight
+    # to a tag instead of substring-scanning every line
+    _PREFIX_TAG = {
+        "[Upload]": "upload",
+        "[OAuth]": "oauth",
+        "[Poll]": "upload",
+        "[Token]": "oauth",
+    }
+
+    # Compiled once; re.I avoids the per-message .lower() allocation and each
+    # alternation scans the line in a single C-level pass
+    _OAUTH_RE  = re.compile(r"oauth|token|auth|connect|disconnect", re.I)
+    _UPLOAD_RE = re.compile(r"upload|poll|asset|download|zip|extract", re.I)
+    _ERR_RE    = re.compile(r"error|fail|exception|invalid|denied", re.I)
+    _OK_RE     = re.compile(r"success|completed|ready|started|running", re.I)
+
     def _tag_for(self, msg: str) -> str:
-        lo = msg.lower()
-        if any(k in lo for k in ("oauth", "token", "auth", "connect", "disconnect")):
+        tag = self._PREFIX_TAG.get(msg.split(" ", 1)[0])
+        if tag:
+            return tag
+        # Fallback scan for unprefixed messages (startup banner, errors)
+        if self._OAUTH_RE.search(msg):
             return "oauth"
-        if any(k in lo for k in ("upload", "poll", "asset", "download", "zip", "extract")):
+        if self._UPLOAD_RE.search(msg):
             return "upload"
-        if any(k in lo for k in ("error", "fail", "exception", "invalid", "denied")):
+        if self._ERR_RE.search(msg):
             return "err"
-        if any(k in lo for k in ("success", "completed", "ready", "started", "running")):
+        if self._OK_RE.search(msg):
             return "ok"
         return "info"
 
-    def _flush_queue(self):
-        try:
-            while True:
-                msg = self._q.get_nowait()
-                self._append_log(msg)
-        except queue.Empty:
-            pass
-        self.root.after(80, self._flush_queue)
+    def _drain_queue(self):
+        # Runs on a daemon thread: block on the queue instead of waking the
+        # Tk loop every 80 ms, and coalesce bursts into one scheduled update.
+        while True:
+            batch = [self._q.get()]
+            try:
+                # Cap the batch so a logging burst never hands the Tk thread
+                # an unbounded amount of work in a single idle callback;
+                # the remainder is picked up by the next loop iteration
+                while len(batch) < 200:
+                    batch.append(self._q.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                self.root.after_idle(self._append_log_batch, batch)
+            except tk.TclError:
+                return  # window closed
 
-    def _append_log(self, message: str):
+    def _append_log_batch(self, messages: "list[str]"):
         ts = datetime.datetime.now().strftime("%H:%M:%S")
-        tag = self._tag_for(message)
+        formatted = [
+            (f"[{ts}] ", f"{message}\n", self._tag_for(message))
+            for message in messages
+        ]
+        # The deque drops overflow off the front for us; mirror that by
+        # deleting the same number of lines from the top of the widget
+        dropped = max(0, len(self._lines) + len(formatted) - self._lines.maxlen)
+        self._lines.extend(formatted)
+        # Tk accepts alternating text/tag arguments, so the whole batch goes
+        # in with a single insert call
+        pieces = []
+        for ts_part, text, tag in formatted[-self._lines.maxlen:]:
+            pieces += (ts_part, "ts", text, tag)
         self._log.configure(state=tk.NORMAL)
-        self._log.insert(tk.END, f"[{ts}] ", "ts")
-        self._log.insert(tk.END, f"{message}\n", tag)
+        if dropped:
+            self._log.delete("1.0", f"{dropped + 1}.0")
+        self._log.insert(tk.END, *pieces)
         self._log.see(tk.END)
-        total = int(self._log.index("end-1c").split(".")[0])
-        if total > 500:
-            self._log.delete("1.0", f"{total - 500}.0")
         self._log.configure(state=tk.DISABLED)
 
     # ── Status setters (thread-safe via root.after) ───────────────
@@ -904,9 +1243,9 @@ class BridgeGUI:
         self._dot_set(self._server_dot, self.C_PINK)
         self._server_lbl.configure(text=text, fg=self.C_PINK)
 
-    def _poll_roblox(self):
-        connected = bool(user_tokens.get("access_token"))
-        username = (user_tokens.get("user_info") or {}).get("username", "")
+    def _apply_roblox_status(self, connected: bool, username: str = ""):
+        # Called via root.after from the server endpoints whenever the token
+        # state actually changes -- no periodic polling needed
         if connected:
             self._dot_set(self._roblox_dot, self.C_LIME)
             self._roblox_lbl.configure(
@@ -914,7 +1253,6 @@ class BridgeGUI:
         else:
             self._dot_set(self._roblox_dot, self.C_GRAY)
             self._roblox_lbl.configure(text="Not Connected", fg=self.C_DIM)
-        self.root.after(2500, self._poll_roblox)
 
     # ── Server thread ─────────────────────────────────────────────
 
@@ -922,27 +1260,29 @@ class BridgeGUI:
         import socket as _sock
         import uvicorn
 
-        # Detect duplicate instance before binding
+        # uvloop's libuv-based loop cuts per-call asyncio overhead; it does
+        # not support Windows, where the default loop is kept.
+        if sys.platform != "win32":
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
+
+        # Detect duplicate instance before binding. connect_ex returns an
+        # errno instead of raising, so the common no-duplicate case skips
+        # the exception machinery; localhost refusal is near-instant.
         probe = _sock.socket(_sock.AF_INET, _sock.SOCK_STREAM)
-        probe.settimeout(0.5)
-        try:
-            probe.connect(("127.0.0.1", self.port))
-            probe.close()
+        probe.settimeout(0.2)
+        err = probe.connect_ex(("127.0.0.1", self.port))
+        probe.close()
+        if err == 0:
             self._q.put("Another instance is already running on this port.")
             self.root.after(0, self._on_duplicate)
             return
-        except (_sock.timeout, ConnectionRefusedError, OSError):
-            probe.close()
 
         self._q.put(f"Starting server…")
         try:
-            import logging
-            logging.basicConfig(
-                level=logging.WARNING,
-                format="%(message)s",
-                stream=sys.stdout,
-                force=True,
-            )
             config = uvicorn.Config(
                 app,
                 host="127.0.0.1",
@@ -981,6 +1321,11 @@ class BridgeGUI:
 
     def run(self):
         sys.stdout = _StdoutToQueue(self._q, sys.__stdout__)
+        logger.addHandler(_QueueLogHandler(self._q))
+        # uvicorn logs propagate to root (log_config=None); surface its
+        # warnings and tracebacks in the activity log too
+        logging.getLogger().addHandler(_QueueLogHandler(self._q, level=logging.WARNING))
+        app.state.gui = self  # lets the endpoints push status updates
 
         # Enqueue banner before starting the server thread so it always
         # appears first in the log (queue is FIFO, server messages follow).
@@ -991,8 +1336,7 @@ class BridgeGUI:
             self._q.put(line)
 
         threading.Thread(target=self._run_server, daemon=True).start()
-        self.root.after(80, self._flush_queue)
-        self.root.after(2500, self._poll_roblox)
+        threading.Thread(target=self._drain_queue, daemon=True).start()
         self.root.mainloop()
 
 
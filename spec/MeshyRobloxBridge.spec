@@ -27,7 +27,7 @@ a = Analysis(
         'uvicorn.lifespan',
         'uvicorn.lifespan.on',
         'click',
-    ],
+    ] + (['uvloop'] if sys.platform != 'win32' else []),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],